@@ -2,18 +2,24 @@
 Configuration and constants for Rock-Paper-Scissors-Plus Game Referee
 """
 
+from types import MappingProxyType
+
 # Game constants
 VALID_MOVES = ["rock", "paper", "scissors", "bomb"]
+VALID_MOVES_SET = frozenset(VALID_MOVES)  # for O(1) membership tests
 MAX_ROUNDS = 3
 BOMB_LIMIT = 1  # per player
 
-# Win rules matrix - what each move beats
-WIN_MATRIX = {
-    "rock": "scissors",
-    "paper": "rock",
-    "scissors": "paper",
-    "bomb": ["rock", "paper", "scissors"]  # bomb beats all normal moves
-}
+# Integer move ids, indexed in VALID_MOVES order
+MOVE_ID = {move: move_id for move_id, move in enumerate(VALID_MOVES)}
+
+# Win rules - bitmask of the move ids each move beats (bit n set = beats move id n)
+BEATS_MASK = (
+    0b0100,  # rock beats scissors
+    0b0001,  # paper beats rock
+    0b0010,  # scissors beats paper
+    0b0111,  # bomb beats rock, paper and scissors
+)
 
 # Game state schema
 STATE_SCHEMA = {
@@ -24,20 +30,30 @@ STATE_SCHEMA = {
     "bot_bomb_used": bool,  # Whether bot used bomb
     "game_over": bool,      # Game completion flag
     "winner": str,          # "user", "bot", or "tie"
-    "history": list         # List of round results
+    "history": list         # List of round result tuples (see HISTORY_FIELDS)
 }
 
-# Default state for new games
-DEFAULT_STATE = {
+# Field order of each history entry
+HISTORY_FIELDS = ("round", "user_move", "bot_move", "winner", "reason")
+
+# Read-only template for new games; use new_state() to get a mutable copy
+DEFAULT_STATE = MappingProxyType({
     "round": 0,
     "user_score": 0,
     "bot_score": 0,
     "user_bomb_used": False,
     "bot_bomb_used": False,
     "game_over": False,
-    "winner": None,
-    "history": []
-}
+    "winner": None
+})
+
+
+def new_state() -> dict:
+    """Build a fresh game state with its own history list."""
+    state = dict(DEFAULT_STATE)
+    state["history"] = []
+    return state
+
 
 # Response templates
 GAME_INTRO = """Welcome to Rock-Paper-Scissors-Plus! 🎮
@@ -1,6 +1,8 @@
 import random
-from typing import Dict, Literal, Optional
-from config import VALID_MOVES, WIN_MATRIX
+from bisect import bisect
+from functools import lru_cache
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+from config import VALID_MOVES, VALID_MOVES_SET, MOVE_ID, BEATS_MASK, MAX_ROUNDS
 
 
 def is_valid_move(move: str) -> bool:
@@ -13,10 +15,10 @@ def is_valid_move(move: str) -> bool:
     Returns:
         True if move is valid, False otherwise
     """
-    normalized = move.lower().strip()
-    return normalized in VALID_MOVES
+    return MOVE_ID.get(move.lower().strip()) is not None
 
 
+@lru_cache(maxsize=64)
 def normalize_move(move: str) -> Optional[str]:
     """
     Normalize user input to a valid move name.
@@ -30,7 +32,104 @@ def normalize_move(move: str) -> Optional[str]:
     if not move:
         return None
     normalized = move.lower().strip()
-    return normalized if normalized in VALID_MOVES else None
+    return normalized if normalized in VALID_MOVES_SET else None
+
+
+def validate_moves_batch(moves: Iterable[str]) -> List[int]:
+    """
+    Normalize and encode many raw moves in one pass.
+
+    Meant for replaying logged sessions, where building a full validation
+    result per move is unnecessary.
+
+    Args:
+        moves: Raw user inputs
+
+    Returns:
+        List of move ids (see config.MOVE_ID), with -1 for invalid moves
+    """
+    move_id = MOVE_ID.get
+    return [move_id(normalize_move(move), -1) for move in moves]
+
+
+def _build_outcome_table() -> Dict:
+    """
+    Precompute the round outcome for every (user_move, bot_move) pair.
+
+    Returns:
+        Dictionary mapping move pairs to (winner, bomb_used) tuples
+    """
+    bomb_id = MOVE_ID["bomb"]
+    table = {}
+    for user_move, user_id in MOVE_ID.items():
+        for bot_move, bot_id in MOVE_ID.items():
+            bomb_used = bomb_id in (user_id, bot_id)
+            if BEATS_MASK[user_id] >> bot_id & 1:
+                winner = "user"
+            elif BEATS_MASK[bot_id] >> user_id & 1:
+                winner = "bot"
+            else:
+                winner = "draw"
+            table[(user_move, bot_move)] = (winner, bomb_used)
+    return table
+
+
+OUTCOME = _build_outcome_table()
+
+# Round outcome indexed [user_id][bot_id]: 1 user wins, -1 bot wins, 0 draw
+OUTCOME_BY_ID = tuple(
+    tuple((BEATS_MASK[u] >> b & 1) - (BEATS_MASK[b] >> u & 1) for b in range(len(VALID_MOVES)))
+    for u in range(len(VALID_MOVES))
+)
+
+# Reason templates keyed by (winner, bomb_used)
+REASON_TEMPLATES = {
+    ("draw", True): "Both players used bomb! It's a draw.",
+    ("user", True): "💥 BOOM! Your bomb obliterated the bot's {bot_move}!",
+    ("bot", True): "💥 BOOM! Bot's bomb obliterated your {user_move}!",
+    ("draw", False): "Both chose {user_move}. It's a draw!",
+    ("user", False): "{User_move} beats {bot_move}!",
+    ("bot", False): "{Bot_move} beats {user_move}!",
+}
+
+# Precomputed reason string for every (user_move, bot_move) pair
+REASONS = {
+    (user_move, bot_move): REASON_TEMPLATES[outcome].format(
+        user_move=user_move,
+        bot_move=bot_move,
+        User_move=user_move.capitalize(),
+        Bot_move=bot_move.capitalize()
+    )
+    for (user_move, bot_move), outcome in OUTCOME.items()
+}
+
+
+def determine_winner_fast(user_move: str, bot_move: str) -> Tuple[str, bool]:
+    """
+    Determine the winner of a round without building a reason.
+
+    Args:
+        user_move: User's validated move
+        bot_move: Bot's chosen move
+
+    Returns:
+        Tuple of (winner, bomb_used)
+    """
+    return OUTCOME[(user_move, bot_move)]
+
+
+def format_reason(user_move: str, bot_move: str) -> str:
+    """
+    Build the outcome explanation for a round.
+
+    Args:
+        user_move: User's validated move
+        bot_move: Bot's chosen move
+
+    Returns:
+        Human-readable reason string
+    """
+    return REASONS[(user_move, bot_move)]
 
 
 def determine_winner(user_move: str, bot_move: str) -> Dict:
@@ -42,49 +141,17 @@ def determine_winner(user_move: str, bot_move: str) -> Dict:
         bot_move: Bot's chosen move
 
     Returns:
-        Dictionary with winner, reason, and bomb_used flag
-    """
-    # Handle bomb special cases first
-    if user_move == "bomb" and bot_move == "bomb":
-        return {
-            "winner": "draw",
-            "reason": "Both players used bomb! It's a draw.",
-            "bomb_used": True
-        }
-    elif user_move == "bomb":
-        return {
-            "winner": "user",
-            "reason": f"💥 BOOM! Your bomb obliterated the bot's {bot_move}!",
-            "bomb_used": True
-        }
-    elif bot_move == "bomb":
-        return {
-            "winner": "bot",
-            "reason": f"💥 BOOM! Bot's bomb obliterated your {user_move}!",
-            "bomb_used": True
-        }
-
-    # Standard RPS rules
-    if user_move == bot_move:
-        return {
-            "winner": "draw",
-            "reason": f"Both chose {user_move}. It's a draw!",
-            "bomb_used": False
-        }
-
-    # Check win matrix
-    if WIN_MATRIX[user_move] == bot_move:
-        return {
-            "winner": "user",
-            "reason": f"{user_move.capitalize()} beats {bot_move}!",
-            "bomb_used": False
-        }
-    else:
-        return {
-            "winner": "bot",
-            "reason": f"{bot_move.capitalize()} beats {user_move}!",
-            "bomb_used": False
-        }
+        Dictionary with winner, reason, bomb_used flag, and both moves
+    """
+    winner, bomb_used = determine_winner_fast(user_move, bot_move)
+
+    return {
+        "winner": winner,
+        "reason": format_reason(user_move, bot_move),
+        "bomb_used": bomb_used,
+        "user_move": user_move,
+        "bot_move": bot_move
+    }
 
 
 def can_use_bomb(bomb_used: bool) -> bool:
@@ -100,6 +167,40 @@ def can_use_bomb(bomb_used: bool) -> bool:
     return not bomb_used
 
 
+def _build_bot_policy() -> Dict:
+    """
+    Precompute the bot's move distribution for every bomb/round combination.
+
+    Returns:
+        Dictionary mapping (user_bomb_used, bot_bomb_used, round) to
+        (moves, cum_weights) for random.choices
+    """
+    moves = tuple(VALID_MOVES)
+    policy = {}
+    for user_bomb_used in (False, True):
+        for bot_bomb_used in (False, True):
+            for current_round in range(MAX_ROUNDS):
+                # Rounds without a scripted bomb chance play normal moves only
+                bomb_chance = 0.0
+                if not bot_bomb_used:
+                    if current_round == 0:
+                        bomb_chance = 0.2
+                    elif current_round == 1:
+                        bomb_chance = 0.4
+                    elif current_round == 2 and not user_bomb_used:
+                        # Final round: go for it if the user can't answer with a bomb
+                        bomb_chance = 0.7
+                normal_chance = (1.0 - bomb_chance) / 3
+                cum_weights = (normal_chance, 2 * normal_chance, 3 * normal_chance, 1.0)
+                policy[(user_bomb_used, bot_bomb_used, current_round)] = (moves, cum_weights)
+    return policy
+
+
+BOT_POLICY = _build_bot_policy()
+
+_NORMAL_MOVES = ("rock", "paper", "scissors")
+
+
 def generate_bot_move(user_bomb_used: bool, bot_bomb_used: bool, current_round: int) -> str:
     """
     Generate a bot move with basic strategy.
@@ -117,20 +218,63 @@ def generate_bot_move(user_bomb_used: bool, bot_bomb_used: bool, current_round:
     Returns:
         Bot's chosen move
     """
-    normal_moves = ["rock", "paper", "scissors"]
+    policy = BOT_POLICY.get((bool(user_bomb_used), bool(bot_bomb_used), current_round))
+    if policy is None:
+        return _NORMAL_MOVES[random.randrange(3)]
 
-    if not bot_bomb_used:
-        if current_round == 2 and not user_bomb_used:
-            if random.random() < 0.7:  
-                return "bomb"
+    moves, cum_weights = policy
+    return random.choices(moves, cum_weights=cum_weights)[0]
 
-        if current_round == 0 and random.random() < 0.2:
-            return "bomb"
 
-        if current_round == 1 and random.random() < 0.4:
-            return "bomb"
+def simulate_games(n: int, seed: Optional[int] = None) -> Dict[str, int]:
+    """
+    Simulate full games of a random user against the bot strategy.
 
-    return random.choice(normal_moves)
+    Works on move ids and the outcome table only, skipping reason
+    formatting and session state, so it is cheap enough for bot tuning.
+
+    Args:
+        n: Number of games to play
+        seed: Optional seed for reproducible runs
+
+    Returns:
+        Dictionary with the number of games won by "user", "bot", or "tie"
+    """
+    # Hot loop: bind the RNG and tables to locals and sample the bot's
+    # move straight from the policy's cumulative weights
+    rand = random.Random(seed).random
+    bomb_id = MOVE_ID["bomb"]
+    outcome_by_id = OUTCOME_BY_ID
+    # Per round: bot cum_weights indexed by 2 * user_bomb_used + bot_bomb_used
+    round_policies = tuple(
+        tuple(
+            BOT_POLICY[(user_bomb_used, bot_bomb_used, current_round)][1]
+            for user_bomb_used in (False, True)
+            for bot_bomb_used in (False, True)
+        )
+        for current_round in range(MAX_ROUNDS)
+    )
+    user_wins = bot_wins = 0
+
+    for _ in range(n):
+        score_diff = 0
+        user_bomb_used = bot_bomb_used = False
+
+        for policies in round_policies:
+            # The user picks uniformly among the moves still available
+            user_id = int(rand() * (bomb_id if user_bomb_used else bomb_id + 1))
+            bot_id = bisect(policies[2 * user_bomb_used + bot_bomb_used], rand())
+
+            score_diff += outcome_by_id[user_id][bot_id]
+            user_bomb_used = user_bomb_used or user_id == bomb_id
+            bot_bomb_used = bot_bomb_used or bot_id == bomb_id
+
+        if score_diff > 0:
+            user_wins += 1
+        elif score_diff < 0:
+            bot_wins += 1
+
+    return {"user": user_wins, "bot": bot_wins, "tie": n - user_wins - bot_wins}
 
 
 def calculate_final_winner(user_score: int, bot_score: int) -> Literal["user", "bot", "tie"]:
@@ -166,6 +310,14 @@ def format_score(user_score: int, bot_score: int) -> str:
     return f"You {user_score} - {bot_score} Bot"
 
 
+_MOVE_EMOJI = {
+    "rock": "🪨",
+    "paper": "📄",
+    "scissors": "✂️",
+    "bomb": "💣"
+}
+
+
 def get_move_emoji(move: str) -> str:
     """
     Get emoji for a move.
@@ -176,10 +328,4 @@ def get_move_emoji(move: str) -> str:
     Returns:
         Emoji string
     """
-    emojis = {
-        "rock": "🪨",
-        "paper": "📄",
-        "scissors": "✂️",
-        "bomb": "💣"
-    }
-    return emojis.get(move, "")
+    return _MOVE_EMOJI.get(move, "")
@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+from functools import wraps
+from typing import Dict, Optional, Tuple
 from game_logic import (
     normalize_move,
     determine_winner,
@@ -6,9 +7,28 @@ from game_logic import (
     calculate_final_winner,
     format_score
 )
-from config import VALID_MOVES, MAX_ROUNDS, DEFAULT_STATE
+from config import VALID_MOVES, MAX_ROUNDS, HISTORY_FIELDS, new_state
 
 
+def ensures_state(tool):
+    """
+    Initialize the session's game state before running a tool, if needed.
+
+    Args:
+        tool: ADK tool function taking the session as first argument
+
+    Returns:
+        Wrapped tool function
+    """
+    @wraps(tool)
+    def wrapper(session, *args, **kwargs):
+        if not getattr(session, 'state', None):
+            session.state = new_state()
+        return tool(session, *args, **kwargs)
+    return wrapper
+
+
+@ensures_state
 def validate_move_tool(session, move: str) -> Dict:
     """
     Validates a user's move against game rules.
@@ -22,9 +42,7 @@ def validate_move_tool(session, move: str) -> Dict:
     Returns:
         Dictionary with validation result
     """
-    # Initialize state if needed
-    if not hasattr(session, 'state') or not session.state:
-        session.state = DEFAULT_STATE.copy()
+    user_bomb_used = session.state["user_bomb_used"]
 
     # Normalize input
     normalized = normalize_move(move)
@@ -34,13 +52,13 @@ def validate_move_tool(session, move: str) -> Dict:
         return {
             "valid": False,
             "move": None,
-            "can_use_bomb": not session.state.get("user_bomb_used", False),
+            "can_use_bomb": not user_bomb_used,
             "error": f"Invalid move '{move}'. Choose: rock, paper, scissors, or bomb"
         }
 
     # Check bomb usage
     if normalized == "bomb":
-        if session.state.get("user_bomb_used", False):
+        if user_bomb_used:
             return {
                 "valid": False,
                 "move": None,
@@ -51,7 +69,7 @@ def validate_move_tool(session, move: str) -> Dict:
     return {
         "valid": True,
         "move": normalized,
-        "can_use_bomb": not session.state.get("user_bomb_used", False),
+        "can_use_bomb": not user_bomb_used,
         "error": None
     }
 
@@ -70,18 +88,11 @@ def resolve_round_tool(session, user_move: str, bot_move: str) -> Dict:
     Returns:
         Dictionary with round result
     """
-    # Determine winner using game logic
-    result = determine_winner(user_move, bot_move)
-
-    return {
-        "winner": result["winner"],
-        "reason": result["reason"],
-        "bomb_used": result["bomb_used"],
-        "user_move": user_move,
-        "bot_move": bot_move
-    }
+    # Game logic already returns the full round result
+    return determine_winner(user_move, bot_move)
 
 
+@ensures_state
 def update_game_state_tool(session, winner: str, user_move: str,
                           bot_move: str, reason: str) -> Dict:
     """
@@ -99,49 +110,69 @@ def update_game_state_tool(session, winner: str, user_move: str,
     Returns:
         Dictionary with updated state
     """
-    # Initialize state if needed
-    if not hasattr(session, 'state') or not session.state:
-        session.state = DEFAULT_STATE.copy()
+    state = session.state
 
     # Increment round
-    current_round = session.state.get("round", 0)
-    session.state["round"] = current_round + 1
+    state["round"] += 1
 
     # Update scores
     if winner == "user":
-        session.state["user_score"] += 1
+        state["user_score"] += 1
     elif winner == "bot":
-        session.state["bot_score"] += 1
+        state["bot_score"] += 1
 
     # Track bomb usage
     if user_move == "bomb":
-        session.state["user_bomb_used"] = True
+        state["user_bomb_used"] = True
     if bot_move == "bomb":
-        session.state["bot_bomb_used"] = True
+        state["bot_bomb_used"] = True
 
     # Record history
-    if "history" not in session.state:
-        session.state["history"] = []
-
-    session.state["history"].append({
-        "round": session.state["round"],
-        "user_move": user_move,
-        "bot_move": bot_move,
-        "winner": winner,
-        "reason": reason
-    })
+    state["history"].append((state["round"], user_move, bot_move, winner, reason))
 
     return {
         "success": True,
-        "round": session.state["round"],
-        "user_score": session.state["user_score"],
-        "bot_score": session.state["bot_score"],
-        "user_bomb_used": session.state["user_bomb_used"],
-        "bot_bomb_used": session.state["bot_bomb_used"],
-        "message": f"Round {session.state['round']} complete"
+        "round": state["round"],
+        "user_score": state["user_score"],
+        "bot_score": state["bot_score"],
+        "user_bomb_used": state["user_bomb_used"],
+        "bot_bomb_used": state["bot_bomb_used"],
+        "message": f"Round {state['round']} complete"
     }
 
 
+def _final_result(user_score: int, bot_score: int) -> Tuple[str, str]:
+    """
+    Compute the overall winner and its announcement for a final score.
+
+    Args:
+        user_score: User's total wins
+        bot_score: Bot's total wins
+
+    Returns:
+        Tuple of (winner, reason)
+    """
+    winner = calculate_final_winner(user_score, bot_score)
+
+    if winner == "user":
+        reason = f"🎉 You won {user_score}-{bot_score}!"
+    elif winner == "bot":
+        reason = f"🤖 Bot won {bot_score}-{user_score}."
+    else:
+        reason = f"🤝 It's a tie at {user_score}-{bot_score}!"
+
+    return winner, reason
+
+
+# Precomputed final results for every score reachable in MAX_ROUNDS rounds
+FINAL_RESULTS = {
+    (user_score, bot_score): _final_result(user_score, bot_score)
+    for user_score in range(MAX_ROUNDS + 1)
+    for bot_score in range(MAX_ROUNDS + 1 - user_score)
+}
+
+
+@ensures_state
 def check_game_end_tool(session) -> Dict:
     """
     Checks if the game should end and determines the winner.
@@ -154,26 +185,19 @@ def check_game_end_tool(session) -> Dict:
     Returns:
         Dictionary with game end status
     """
-    # Initialize state if needed
-    if not hasattr(session, 'state') or not session.state:
-        session.state = DEFAULT_STATE.copy()
-
-    current_round = session.state.get("round", 0)
-    user_score = session.state.get("user_score", 0)
-    bot_score = session.state.get("bot_score", 0)
+    state = session.state
+    current_round = state["round"]
+    user_score = state["user_score"]
+    bot_score = state["bot_score"]
 
     # Check if game complete
     if current_round >= MAX_ROUNDS:
-        session.state["game_over"] = True
-        winner = calculate_final_winner(user_score, bot_score)
-        session.state["winner"] = winner
-
-        if winner == "user":
-            reason = f"🎉 You won {user_score}-{bot_score}!"
-        elif winner == "bot":
-            reason = f"🤖 Bot won {bot_score}-{user_score}."
-        else:
-            reason = f"🤝 It's a tie at {user_score}-{bot_score}!"
+        state["game_over"] = True
+        final_result = FINAL_RESULTS.get((user_score, bot_score))
+        if final_result is None:
+            final_result = _final_result(user_score, bot_score)
+        winner, reason = final_result
+        state["winner"] = winner
 
         return {
             "game_over": True,
@@ -210,7 +234,7 @@ def reset_game_tool(session) -> Dict:
     Returns:
         Dictionary with new game state
     """
-    session.state = DEFAULT_STATE.copy()
+    session.state = new_state()
 
     return {
         "success": True,
@@ -219,6 +243,7 @@ def reset_game_tool(session) -> Dict:
     }
 
 
+@ensures_state
 def get_game_state_tool(session) -> Dict:
     """
     Retrieves the current game state.
@@ -231,17 +256,15 @@ def get_game_state_tool(session) -> Dict:
     Returns:
         Current game state
     """
-    # Initialize state if needed
-    if not hasattr(session, 'state') or not session.state:
-        session.state = DEFAULT_STATE.copy()
+    state = session.state
 
     return {
-        "round": session.state.get("round", 0),
-        "user_score": session.state.get("user_score", 0),
-        "bot_score": session.state.get("bot_score", 0),
-        "user_bomb_used": session.state.get("user_bomb_used", False),
-        "bot_bomb_used": session.state.get("bot_bomb_used", False),
-        "game_over": session.state.get("game_over", False),
-        "winner": session.state.get("winner"),
-        "history": session.state.get("history", [])
+        "round": state["round"],
+        "user_score": state["user_score"],
+        "bot_score": state["bot_score"],
+        "user_bomb_used": state["user_bomb_used"],
+        "bot_bomb_used": state["bot_bomb_used"],
+        "game_over": state["game_over"],
+        "winner": state["winner"],
+        "history": [dict(zip(HISTORY_FIELDS, entry)) for entry in state["history"]]
     }
@@ -5,17 +5,35 @@ ADK Agent setup with HIGHLY POLISHED, animated, dramatic UX
 
 import sys
 import io
+import atexit
 import time
-import os
 import random
+import queue
+import threading
+from collections import deque
+from functools import lru_cache
 from typing import Optional
 
-# Set UTF-8 encoding for Windows console compatibility
+# Set UTF-8 encoding for Windows console compatibility.
+# stdout is block-buffered; prompts flush explicitly and exit flushes the rest.
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(sys.stdout.buffer, buffer_size=65536),
+        encoding='utf-8', errors='replace', line_buffering=False
+    )
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
-from config import VALID_MOVES, MAX_ROUNDS, DEFAULT_STATE
+    atexit.register(sys.stdout.flush)
+
+    # Turn on ANSI escape handling (ENABLE_VIRTUAL_TERMINAL_PROCESSING) for
+    # legacy consoles, which otherwise print colour codes and clear_screen raw
+    import ctypes
+    _kernel32 = ctypes.windll.kernel32
+    _handle = _kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    _mode = ctypes.c_ulong()
+    if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):
+        _kernel32.SetConsoleMode(_handle, _mode.value | 0x0004)
+
+from config import VALID_MOVES, MAX_ROUNDS, new_state
 from game_logic import generate_bot_move, get_move_emoji
 from game_tools import (
     validate_move_tool,
@@ -26,6 +44,9 @@ from game_tools import (
     get_game_state_tool
 )
 
+# Emoji lookups hit a static 4-entry table; skip the Python-level call on repeats
+get_move_emoji = lru_cache(maxsize=8)(get_move_emoji)
+
 
 # ANSI Color codes
 class Colors:
@@ -48,39 +69,24 @@ class Colors:
     INFO = '\033[96m\033[1m'
 
 
-def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-
-def type_text(text: str, delay: float = 0.02, color: str = ''):
-    """Type out text character by character for dramatic effect."""
-    for char in text:
-        sys.stdout.write(f"{color}{char}{Colors.END}")
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
-
-
-def print_loading_bar(text: str = "Loading"):
-    """Show a loading animation."""
-    print(f"\n{Colors.CYAN}{text}", end='', flush=True)
-    for _ in range(20):
-        time.sleep(0.05)
-        print(".", end='', flush=True)
-    print(f"{Colors.END}\n")
-
+# Only emit ANSI escapes to a terminal; piped or redirected output stays plain.
+# Must run before any of the module-level screens below are formatted.
+_USE_ANSI = sys.stdout.isatty()
+if not _USE_ANSI:
+    for _name in [attr for attr in vars(Colors) if not attr.startswith('_')]:
+        setattr(Colors, _name, '')
 
-def dramatic_pause(duration: float = 0.5):
-    """Create suspense with a pause."""
-    time.sleep(duration)
 
+# Separators
+_SEP_DBL = '═' * 65
+_SEP_SGL = '─' * 65
+_CYAN_SEP_DBL = f"{Colors.CYAN}{_SEP_DBL}{Colors.END}"
+_CYAN_SEP_SGL = f"{Colors.CYAN}{_SEP_SGL}{Colors.END}"
 
-def print_banner():
-    """Print epic animated welcome banner."""
-    clear_screen()
+# Static screens, formatted once at import
+_PROMPT = f"{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END}: "
 
-    banner = f"""
+_BANNER = f"""
 {Colors.BOLD}{Colors.CYAN}
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                                                                   ║
@@ -93,12 +99,8 @@ def print_banner():
 ╚═══════════════════════════════════════════════════════════════════╝
 {Colors.END}
 """
-    print(banner)
-
 
-def print_rules():
-    """Print game rules with nice formatting."""
-    rules = f"""
+_RULES = f"""
 {Colors.BOLD}{Colors.YELLOW}
 ╔═══════════════════════════ GAME RULES ═══════════════════════════╗
 ║                                                                   ║
@@ -114,7 +116,125 @@ def print_rules():
 {Colors.INFO}Commands:{Colors.CYAN} 'new game'{Colors.END} | {Colors.RED}'quit'{Colors.END}
 
 """
-    print(rules)
+
+_NEW_GAME_BANNER = f"""
+{Colors.GREEN}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║                    ✨ NEW GAME STARTED! ✨                        ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.END}
+"""
+
+_GAME_OVER_BANNER = f"""
+{Colors.YELLOW}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                      GAME ALREADY OVER                            ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.END}
+
+"""
+
+_GAME_OVER_MENU = f"""
+{Colors.BOLD}What's next?{Colors.END}
+  • {Colors.GREEN}'new game'{Colors.END} - Play again
+  • {Colors.RED}'quit'{Colors.END} - Exit
+
+Your choice: """
+
+_VICTORY_BANNER = f"""{Colors.GREEN}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║                                                                   ║
+║       🏆🏆🏆  ★★★ CHAMPION! ★★★  🏆🏆🏆                        ║
+║                                                                   ║
+║              YOU HAVE DEFEATED THE BOT!                          ║
+║                                                                   ║
+║                   CONGRATULATIONS!!!                             ║
+║                                                                   ║
+║               🎉🎉🎉 VICTORY! 🎉🎉🎉                            ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.END}"""
+
+_DEFEAT_BANNER = f"""{Colors.RED}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║                                                                   ║
+║              💀 GAME OVER - BOT WINS 💀                          ║
+║                                                                   ║
+║              BETTER LUCK NEXT TIME, HUMAN                         ║
+║                                                                   ║
+║                   🤖 0010110101010101 🤖                        ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.END}"""
+
+_TIE_BANNER = f"""{Colors.YELLOW}{Colors.BOLD}
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║                     🤝 PERFECT TIE! 🤝                            ║
+║                                                                   ║
+║              EVENLY MATCHED OPPONENTS!                            ║
+║                                                                   ║
+║                 ⚖️ BALANCE ACHIEVED ⚖️                          ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+{Colors.END}"""
+
+
+def clear_screen():
+    """Clear the terminal screen."""
+    if not _USE_ANSI:
+        return
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+
+def sleep_until(deadline: float):
+    """Sleep until a time.perf_counter() deadline, if it hasn't passed yet."""
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def type_text(text: str, delay: float = 0.02, color: str = '', chunk_size: int = 4):
+    """Type out text a few characters at a time for dramatic effect."""
+    deadline = time.perf_counter()
+    sys.stdout.write(color)
+    for i in range(0, len(text), chunk_size):
+        chunk = text[i:i + chunk_size]
+        deadline += delay * len(chunk)
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        sleep_until(deadline)
+    sys.stdout.write(f"{Colors.END}\n")
+    sys.stdout.flush()
+
+
+def print_loading_bar(text: str = "Loading"):
+    """Show a loading animation."""
+    deadline = time.perf_counter() + 0.05 * 20
+    print(f"\n{Colors.CYAN}{text}{'.' * 20}", end='', flush=True)
+    sleep_until(deadline)
+    print(f"{Colors.END}\n")
+
+
+def dramatic_pause(duration: float = 0.5):
+    """Create suspense with a pause."""
+    time.sleep(duration)
+
+
+def print_banner():
+    """Print epic animated welcome banner."""
+    clear_screen()
+    print(_BANNER)
+
+
+def print_rules():
+    """Print game rules with nice formatting."""
+    print(_RULES)
 
 
 # Bot personality - reactions and taunts
@@ -155,67 +275,112 @@ BOT_REACTIONS = {
 }
 
 
+# Reactions shuffled once and cycled, so no line repeats until all have been used
+_REACTION_DECKS = {
+    situation: deque(random.sample(reactions, len(reactions)))
+    for situation, reactions in BOT_REACTIONS.items()
+}
+
+
 def get_bot_reaction(situation: str) -> str:
-    """Get a random bot reaction."""
-    return random.choice(BOT_REACTIONS.get(situation, BOT_REACTIONS["taunt"]))
+    """Get the next bot reaction for a situation."""
+    deck = _REACTION_DECKS.get(situation, _REACTION_DECKS["taunt"])
+    deck.rotate(-1)
+    return deck[-1]
 
 
-def get_round_display(round_num: int, max_rounds: int) -> str:
-    """Get an animated progress bar."""
+def _build_round_display(round_num: int, max_rounds: int) -> str:
+    """Build the progress bar for a round."""
     filled = '█' * round_num
     empty = '░' * (max_rounds - round_num)
     return f"{Colors.BOLD}{Colors.CYAN}[{Colors.MAGENTA}{filled}{Colors.END}{empty}] Round {round_num}/{max_rounds}"
 
 
+# Progress bars for every round of a standard game
+_ROUND_DISPLAYS = tuple(_build_round_display(i, MAX_ROUNDS) for i in range(MAX_ROUNDS + 1))
+
+
+def get_round_display(round_num: int, max_rounds: int) -> str:
+    """Get an animated progress bar."""
+    if max_rounds == MAX_ROUNDS and 0 <= round_num <= MAX_ROUNDS:
+        return _ROUND_DISPLAYS[round_num]
+    return _build_round_display(round_num, max_rounds)
+
+
 def show_reveal_animation(user_move: str, bot_move: str):
     """Show dramatic reveal animation."""
-    print(f"\n{Colors.CYAN}{'═' * 65}{Colors.END}")
-    print(f"{Colors.BOLD}🎯 REVEALING MOVES...{Colors.END}")
-    print(f"{Colors.CYAN}{'═' * 65}{Colors.END}\n")
-
-    # Show user move
-    print(f"  {Colors.BOLD}YOUR MOVE:{Colors.END}", end='', flush=True)
-    for _ in range(3):
-        time.sleep(0.2)
-        print(".", end='', flush=True)
+    deadline = time.perf_counter() + 0.6
+    sys.stdout.write(
+        f"\n{_CYAN_SEP_DBL}\n"
+        f"{Colors.BOLD}🎯 REVEALING MOVES...{Colors.END}\n"
+        f"{_CYAN_SEP_DBL}\n\n"
+        f"  {Colors.BOLD}YOUR MOVE:{Colors.END}..."
+    )
+    sys.stdout.flush()
+    sleep_until(deadline)
+
+    # Show user move, then pause dramatically before the bot move
+    deadline += 0.75
     user_emoji = get_move_emoji(user_move)
-    print(f" {Colors.GREEN}{user_emoji} {user_move.upper()}{Colors.END} ✓")
-
-    # Dramatic pause before bot move
-    print(f"\n  {Colors.BOLD}BOT THINKING{Colors.END}", end='', flush=True)
-    for _ in range(5):
-        time.sleep(0.15)
-        print(".", end='', flush=True)
-    print()
+    sys.stdout.write(
+        f" {Colors.GREEN}{user_emoji} {user_move.upper()}{Colors.END} ✓\n"
+        f"\n  {Colors.BOLD}BOT THINKING{Colors.END}....."
+    )
+    sys.stdout.flush()
+    sleep_until(deadline)
 
     # Reveal bot move with suspense
     bot_emoji = get_move_emoji(bot_move)
-    print(f"\n  {Colors.BOLD}BOT'S MOVE:{Colors.END} {Colors.RED}{bot_emoji} {bot_move.upper()}{Colors.END} 💥\n")
+    sys.stdout.write(f"\n\n  {Colors.BOLD}BOT'S MOVE:{Colors.END} {Colors.RED}{bot_emoji} {bot_move.upper()}{Colors.END} 💥\n\n")
+    sys.stdout.flush()
+
+
+# Round announcements keyed by (winner, bomb_used)
+_ROUND_ANNOUNCEMENTS = {
+    ("user", True): "💥💥💥 NUCLEAR STRIKE! YOU WIN! 💥💥💥",
+    ("user", False): "🎉🎉🎉 VICTORY IS YOURS! 🎉🎉🎉",
+    ("bot", True): "😢😢😢 DEFEAT! 😢😢😢",
+    ("bot", False): "😢😢😢 DEFEAT! 😢😢😢",
+    ("draw", True): "🤝🤝🤝 DRAW! 🤝🤝🤝",
+    ("draw", False): "🤝🤝🤝 DRAW! 🤝🤝🤝",
+}
+
+# Commands recognized before a move is parsed
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_RESET_COMMANDS = frozenset({"new game", "restart", "reset"})
 
 
 class GameSession:
     """Session class for ADK simulation."""
 
+    __slots__ = ('state',)
+
     def __init__(self):
-        self.state = DEFAULT_STATE.copy()
+        self.state = new_state()
 
 
 class GameRefereeAgent:
     """AI Game Referee with personality and dramatic flair."""
 
+    __slots__ = ('session',)
+
     def __init__(self):
         self.session = GameSession()
 
     def process_user_input(self, user_input: str) -> str:
         """Process user input with dramatic responses."""
-        if user_input.lower().strip() in ["quit", "exit", "q"]:
+        command = user_input.strip().lower()
+
+        if command in _QUIT_COMMANDS:
             return self._handle_quit()
 
-        if user_input.lower().strip() in ["new game", "restart", "reset"]:
+        if command in _RESET_COMMANDS:
             reset_game_tool(self.session)
             return self._get_new_game_message()
 
-        if self.session.state.get("game_over", False):
+        state = self.session.state
+
+        if state["game_over"]:
             return self._format_game_over_menu()
 
         validation = validate_move_tool(self.session, user_input)
@@ -226,9 +391,9 @@ class GameRefereeAgent:
 
         # Generate bot move
         bot_move = generate_bot_move(
-            self.session.state.get("user_bomb_used", False),
-            self.session.state.get("bot_bomb_used", False),
-            self.session.state.get("round", 0)
+            state["user_bomb_used"],
+            state["bot_bomb_used"],
+            state["round"]
         )
 
         # Resolve round
@@ -256,16 +421,7 @@ class GameRefereeAgent:
 
     def _get_new_game_message(self) -> str:
         """New game start message."""
-        return f"""
-{Colors.GREEN}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║                    ✨ NEW GAME STARTED! ✨                        ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.END}
-{self._format_game_header()}
-{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END}: """
+        return _NEW_GAME_BANNER + self._format_game_header() + "\n" + _PROMPT
 
     def _format_game_header(self) -> str:
         """Format game status header."""
@@ -273,9 +429,9 @@ class GameRefereeAgent:
         bomb_status = f"{Colors.MAGENTA}💣 READY{Colors.END}" if not state["user_bomb_used"] else f"{Colors.RED}💣 USED{Colors.END}"
         score_color = Colors.GREEN if state['user_score'] >= state['bot_score'] else Colors.RED
 
-        return f"""{Colors.CYAN}{'─' * 65}{Colors.END}
+        return f"""{_CYAN_SEP_SGL}
   {Colors.BOLD}SCORE:{Colors.END} {score_color}YOU: {state['user_score']}{Colors.END} │ {Colors.RED}BOT: {state['bot_score']}{Colors.END} │ {bomb_status}
-{Colors.CYAN}{'─' * 65}{Colors.END}
+{_CYAN_SEP_SGL}
 """
 
     def _handle_invalid_round(self, error: str):
@@ -294,42 +450,40 @@ class GameRefereeAgent:
         winner = round_result["winner"]
 
         # Build the response
-        response = f"\n{Colors.CYAN}{'═' * 65}{Colors.END}\n"
-        response += f"  {get_round_display(round_num, MAX_ROUNDS)}\n"
-        response += f"{Colors.CYAN}{'═' * 65}{Colors.END}"
+        parts = [
+            f"\n{_CYAN_SEP_DBL}\n",
+            f"  {get_round_display(round_num, MAX_ROUNDS)}\n",
+            _CYAN_SEP_DBL,
+        ]
 
         # Add reveal animation placeholder
-        response += f"""
+        parts.append(f"""
 
 {Colors.BOLD}{self._get_round_announcement(winner, round_result)}{Colors.END}
 
 {round_result['reason']}
 
-{Colors.CYAN}{'─' * 65}{Colors.END}
-"""
+{_CYAN_SEP_SGL}
+""")
 
         # Bot reaction
         if winner == "user":
             if round_result["bomb_used"]:
-                response += f"\n{Colors.MAGENTA}🤖 BOT: {get_bot_reaction('bomb_win')}{Colors.END}\n"
+                parts.append(f"\n{Colors.MAGENTA}🤖 BOT: {get_bot_reaction('bomb_win')}{Colors.END}\n")
             else:
-                response += f"\n{Colors.RED}🤖 BOT: {get_bot_reaction('lose')}{Colors.END}\n"
+                parts.append(f"\n{Colors.RED}🤖 BOT: {get_bot_reaction('lose')}{Colors.END}\n")
         elif winner == "bot":
-            response += f"\n{Colors.RED}🤖 BOT: {get_bot_reaction('win')}{Colors.END}\n"
+            parts.append(f"\n{Colors.RED}🤖 BOT: {get_bot_reaction('win')}{Colors.END}\n")
         else:
-            response += f"\n{Colors.YELLOW}🤖 BOT: {get_bot_reaction('draw')}{Colors.END}\n"
+            parts.append(f"\n{Colors.YELLOW}🤖 BOT: {get_bot_reaction('draw')}{Colors.END}\n")
 
-        return response + f"\n{self._format_game_header()}" + f"{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END}: "
+        parts.append(f"\n{self._format_game_header()}")
+        parts.append(_PROMPT)
+        return "".join(parts)
 
     def _get_round_announcement(self, winner: str, result: dict) -> str:
         """Get dramatic round announcement."""
-        if winner == "user":
-            if result["bomb_used"]:
-                return f"💥💥💥 NUCLEAR STRIKE! YOU WIN! 💥💥💥"
-            return f"🎉🎉🎉 VICTORY IS YOURS! 🎉🎉🎉"
-        elif winner == "bot":
-            return f"😢😢😢 DEFEAT! 😢😢😢"
-        return f"🤝🤝🤝 DRAW! 🤝🤝🤝"
+        return _ROUND_ANNOUNCEMENTS[(winner, result["bomb_used"])]
 
     def _format_invalid_response(self, error: str) -> str:
         """Format invalid input response."""
@@ -346,9 +500,9 @@ class GameRefereeAgent:
 
 {Colors.RED}Round forfeited! Bot wins by default.{Colors.END}
 
-{Colors.CYAN}{'─' * 65}{Colors.END}
+{_CYAN_SEP_SGL}
 """
-        return response + self._format_game_header() + f"{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END}: "
+        return "".join((response, self._format_game_header(), _PROMPT))
 
     def _format_game_over_response(self, round_result: dict, game_status: dict) -> str:
         """Format epic game over response."""
@@ -364,129 +518,82 @@ class GameRefereeAgent:
             banner = self._get_tie_banner()
             color = Colors.YELLOW
 
-        response = f"\n{banner}\n\n"
+        buf = io.StringIO()
+        buf.write(f"\n{banner}\n\n")
 
         # Final result
-        response += f"{color}{Colors.BOLD}{'═' * 65}{Colors.END}\n"
-        response += f"                    FINAL ROUND RESULT{Colors.END}\n"
-        response += f"{color}{Colors.BOLD}{'═' * 65}{Colors.END}\n\n"
+        buf.write(f"{color}{Colors.BOLD}{_SEP_DBL}{Colors.END}\n")
+        buf.write(f"                    FINAL ROUND RESULT{Colors.END}\n")
+        buf.write(f"{color}{Colors.BOLD}{_SEP_DBL}{Colors.END}\n\n")
 
         user_emoji = get_move_emoji(round_result["user_move"])
         bot_emoji = get_move_emoji(round_result["bot_move"])
 
-        response += f"  {Colors.BOLD}YOUR MOVE:{Colors.END}     {Colors.GREEN}{user_emoji} {round_result['user_move'].upper()}{Colors.END}\n"
-        response += f"  {Colors.BOLD}BOT'S MOVE:{Colors.END}     {Colors.RED}{bot_emoji} {round_result['bot_move'].upper()}{Colors.END}\n\n"
+        buf.write(f"  {Colors.BOLD}YOUR MOVE:{Colors.END}     {Colors.GREEN}{user_emoji} {round_result['user_move'].upper()}{Colors.END}\n")
+        buf.write(f"  {Colors.BOLD}BOT'S MOVE:{Colors.END}     {Colors.RED}{bot_emoji} {round_result['bot_move'].upper()}{Colors.END}\n\n")
 
-        response += f"  {color}{round_result['reason']}{Colors.END}\n\n"
+        buf.write(f"  {color}{round_result['reason']}{Colors.END}\n\n")
 
         # Match summary
-        response += self._format_match_summary()
+        buf.write(self._format_match_summary())
 
-        response += f"\n{Colors.CYAN}{'═' * 65}{Colors.END}\n"
-        response += f"\n{Colors.BOLD}What's next?{Colors.END}\n"
-        response += f"  • {Colors.GREEN}'new game'{Colors.END} - Play again\n"
-        response += f"  • {Colors.RED}'quit'{Colors.END} - Exit\n\n"
-        response += f"Your choice: "
+        buf.write(f"\n{_CYAN_SEP_DBL}\n")
+        buf.write(f"\n{Colors.BOLD}What's next?{Colors.END}\n")
+        buf.write(f"  • {Colors.GREEN}'new game'{Colors.END} - Play again\n")
+        buf.write(f"  • {Colors.RED}'quit'{Colors.END} - Exit\n\n")
+        buf.write("Your choice: ")
 
-        return response
+        return buf.getvalue()
 
     def _format_game_over_menu(self) -> str:
         """Game over menu."""
-        state = self.session.state
-        return f"""
-{Colors.YELLOW}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                      GAME ALREADY OVER                            ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.END}
-
-{self._format_game_header()}
-{Colors.BOLD}What's next?{Colors.END}
-  • {Colors.GREEN}'new game'{Colors.END} - Play again
-  • {Colors.RED}'quit'{Colors.END} - Exit
-
-Your choice: """
+        return _GAME_OVER_BANNER + self._format_game_header() + _GAME_OVER_MENU
 
     def _format_match_summary(self) -> str:
         """Generate detailed match summary."""
         state = self.session.state
-        summary = f"{Colors.BOLD}📊 MATCH SUMMARY{Colors.END}\n\n"
+        parts = [f"{Colors.BOLD}📊 MATCH SUMMARY{Colors.END}\n\n"]
 
-        for round_data in state.get("history", []):
-            r = round_data["round"]
-            if round_data["winner"] == "user":
+        for r, _, _, winner, _ in state["history"]:
+            if winner == "user":
                 winner_icon = f"{Colors.GREEN}👤 YOU WIN{Colors.END}"
-            elif round_data["winner"] == "bot":
+            elif winner == "bot":
                 winner_icon = f"{Colors.RED}🤖 BOT WINS{Colors.END}"
             else:
                 winner_icon = f"{Colors.YELLOW}🤝 DRAW{Colors.END}"
 
-            summary += f"  {Colors.CYAN}Round {r}:{Colors.END} {winner_icon}\n"
+            parts.append(f"  {Colors.CYAN}Round {r}:{Colors.END} {winner_icon}\n")
 
-        summary += f"\n{Colors.BOLD}FINAL:{Colors.END} "
+        parts.append(f"\n{Colors.BOLD}FINAL:{Colors.END} ")
         if state['user_score'] > state['bot_score']:
-            summary += f"{Colors.GREEN}YOU WIN {state['user_score']}-{state['bot_score']}{Colors.END} 🏆"
+            parts.append(f"{Colors.GREEN}YOU WIN {state['user_score']}-{state['bot_score']}{Colors.END} 🏆")
         elif state['bot_score'] > state['user_score']:
-            summary += f"{Colors.RED}BOT WINS {state['bot_score']}-{state['user_score']}{Colors.END}"
+            parts.append(f"{Colors.RED}BOT WINS {state['bot_score']}-{state['user_score']}{Colors.END}")
         else:
-            summary += f"{Colors.YELLOW}TIE {state['user_score']}-{state['bot_score']}{Colors.END}"
+            parts.append(f"{Colors.YELLOW}TIE {state['user_score']}-{state['bot_score']}{Colors.END}")
 
-        return summary
+        return "".join(parts)
 
     def _get_victory_banner(self) -> str:
         """Epic victory banner."""
-        return f"""{Colors.GREEN}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║                                                                   ║
-║       🏆🏆🏆  ★★★ CHAMPION! ★★★  🏆🏆🏆                        ║
-║                                                                   ║
-║              YOU HAVE DEFEATED THE BOT!                          ║
-║                                                                   ║
-║                   CONGRATULATIONS!!!                             ║
-║                                                                   ║
-║               🎉🎉🎉 VICTORY! 🎉🎉🎉                            ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.END}"""
+        return _VICTORY_BANNER
 
     def _get_defeat_banner(self) -> str:
         """Defeat banner."""
-        return f"""{Colors.RED}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║                                                                   ║
-║              💀 GAME OVER - BOT WINS 💀                          ║
-║                                                                   ║
-║              BETTER LUCK NEXT TIME, HUMAN                         ║
-║                                                                   ║
-║                   🤖 0010110101010101 🤖                        ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.END}"""
+        return _DEFEAT_BANNER
 
     def _get_tie_banner(self) -> str:
         """Tie banner."""
-        return f"""{Colors.YELLOW}{Colors.BOLD}
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║                     🤝 PERFECT TIE! 🤝                            ║
-║                                                                   ║
-║              EVENLY MATCHED OPPONENTS!                            ║
-║                                                                   ║
-║                 ⚖️ BALANCE ACHIEVED ⚖️                          ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-{Colors.END}"""
+        return _TIE_BANNER
 
     def _handle_quit(self) -> str:
         """Handle quit."""
         state = self.session.state
         if state["round"] > 0:
             return f"""
-{Colors.CYAN}{'═' * 65}{Colors.END}
+{_CYAN_SEP_DBL}
 {Colors.YELLOW}{Colors.BOLD}                    THANKS FOR PLAYING!{Colors.END}
-{Colors.CYAN}{'═' * 65}{Colors.END}
+{_CYAN_SEP_DBL}
 
 {Colors.BOLD}Final Score:{Colors.END} {Colors.GREEN}You: {state['user_score']}{Colors.END} | {Colors.RED}Bot: {state['bot_score']}{Colors.END}
 {Colors.BOLD}Rounds Played:{Colors.END} {state['round']}
@@ -496,47 +603,78 @@ Your choice: """
         return f"\n{Colors.YELLOW}Thanks for playing! 👋{Colors.END}\n"
 
 
+class OutputWriter:
+    """Writes CLI output from a background thread so rendering never blocks input."""
+
+    __slots__ = ('_queue', '_thread')
+
+    def __init__(self, stream):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def write(self, text: str):
+        """Queue text for output."""
+        self._queue.put(text)
+
+    def close(self):
+        """Write any queued output and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self, stream):
+        """Write queued chunks, flushing only once the queue is empty."""
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                stream.flush()
+                return
+            stream.write(chunk)
+            if self._queue.empty():
+                stream.flush()
+
+
 def run_cli():
     """Main CLI loop with epic UX."""
     clear_screen()
     print_banner()
 
     # Animated loading
-    print(f"\n{Colors.CYAN}Initializing AI Game Referee", end='', flush=True)
-    for i in range(15):
-        time.sleep(0.08)
-        print(".", end='', flush=True)
+    deadline = time.perf_counter() + 0.08 * 15
+    print(f"\n{Colors.CYAN}Initializing AI Game Referee{'.' * 15}", end='', flush=True)
+    sleep_until(deadline)
     print(f" {Colors.GREEN}READY!{Colors.END}\n")
 
     agent = GameRefereeAgent()
     print_rules()
 
-    # Initial prompt with bot taunt
+    # Initial prompt with bot taunt; input() flushes stdout before reading
     print(agent._format_game_header(), end='')
-    print(f"{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END} ", end='', flush=True)
+    print(_PROMPT, end='')
 
+    output = OutputWriter(sys.stdout)
     try:
         while True:
-            user_input = sys.stdin.readline()
-
-            if not user_input:
-                print(f"\n\n{Colors.YELLOW}Thanks for playing! 👋{Colors.END}\n")
+            try:
+                user_input = input().strip()
+            except EOFError:
+                output.write(f"\n\n{Colors.YELLOW}Thanks for playing! 👋{Colors.END}\n")
                 break
 
-            user_input = user_input.strip()
-
             if not user_input:
-                print(f"{Colors.INFO}Your move?{Colors.END} {Colors.BOLD}(rock/paper/scissors/bomb){Colors.END}: ", end='', flush=True)
+                output.write(_PROMPT)
                 continue
 
-            # Process and display
+            # Process and hand off for display
             response = agent.process_user_input(user_input)
-            print(response, end="", flush=True)
+            output.write(response)
 
     except KeyboardInterrupt:
-        print(f"\n\n\n{Colors.YELLOW}Game interrupted. Thanks for playing! 👋{Colors.END}\n")
+        output.write(f"\n\n\n{Colors.YELLOW}Game interrupted. Thanks for playing! 👋{Colors.END}\n")
     except Exception as e:
-        print(f"\n\n{Colors.RED}⚠️  Error: {e}{Colors.END}\n")
+        output.write(f"\n\n{Colors.RED}⚠️  Error: {e}{Colors.END}\n")
+    finally:
+        output.close()
 
 
 def main():